@@ -1,9 +1,14 @@
 # Analyze all log groups
+import heapq
+from operator import itemgetter
+
 log_groups = collector.get_log_group_metrics()
 
+top_log_groups = heapq.nlargest(10, log_groups, key=itemgetter('stored_gb'))
+
 print("Top 10 Largest Log Groups:")
 print("-" * 80)
-for i, log_group in enumerate(log_groups[:10], 1):
+for i, log_group in enumerate(top_log_groups, 1):
     print(f"{i}. {log_group['name']}")
     print(f"   Size: {log_group['stored_gb']:.2f} GB")
     print(f"   Retention: {log_group['retention_days']}")
@@ -1,3 +1,5 @@
+from src.utils.cost_analyzer import tiered_cost
+
 # Count all custom metrics in your account
 custom_metrics = collector.get_custom_metric_count()
 
@@ -11,9 +13,6 @@ print(f"\nTotal custom metrics: {total_custom}")
 # Calculate monthly cost estimate
 # First 10,000 metrics = $0.30 per metric
 # Additional metrics = $0.10 per metric
-if total_custom <= 10000:
-    estimated_cost = total_custom * 0.30
-else:
-    estimated_cost = (10000 * 0.30) + ((total_custom - 10000) * 0.10)
+estimated_cost = tiered_cost(total_custom)
     
 print(f"Estimated monthly cost for custom metrics: ${estimated_cost:.2f}")
\ No newline at end of file
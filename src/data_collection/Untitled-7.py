@@ -4,9 +4,14 @@ CloudWatch Cost Analysis Script
 Analyzes CloudWatch usage and provides cost optimization recommendations.
 """
 
+import functools
+import heapq
+import io
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from src.data_collection.cloudwatch.collector import CloudWatchCollector
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(
@@ -19,46 +24,58 @@ logger = logging.getLogger(__name__)
 
 def analyze_cloudwatch_costs(region: str = 'us-east-1'):
     """Perform comprehensive CloudWatch cost analysis."""
+    # Imported here so loading this module doesn't pay for boto3/numpy up front
+    from src.data_collection.cloudwatch.collector import CloudWatchCollector
+    from src.utils.cost_analyzer import tiered_cost
     
-    logger.info(f"Starting CloudWatch cost analysis for region: {region}")
+    # Collect the report in memory and write it to stdout in one call
+    buf = io.StringIO()
+    p = functools.partial(print, file=buf)
+    
+    logger.info("Starting CloudWatch cost analysis for region: %s", region)
     collector = CloudWatchCollector(region=region)
     
+    # The three lookups are independent API calls, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'metrics': executor.submit(collector.get_custom_metric_count),
+            'alarms': executor.submit(collector.get_alarm_count),
+            'logs': executor.submit(collector.get_log_group_metrics)
+        }
+        custom_metrics = futures['metrics'].result()
+        alarm_stats = futures['alarms'].result()
+        log_groups = futures['logs'].result()
+    
     # 1. Analyze Custom Metrics
-    print("\n" + "="*80)
-    print("CUSTOM METRICS ANALYSIS")
-    print("="*80)
+    p("\n" + "="*80)
+    p("CUSTOM METRICS ANALYSIS")
+    p("="*80)
     
-    custom_metrics = collector.get_custom_metric_count()
     total_custom = sum(custom_metrics.values())
     
     if total_custom > 0:
-        print(f"Found {total_custom} custom metrics")
+        p(f"Found {total_custom} custom metrics")
         
         # Calculate cost
-        if total_custom <= 10000:
-            cost = total_custom * 0.30
-        else:
-            cost = (10000 * 0.30) + ((total_custom - 10000) * 0.10)
+        cost = tiered_cost(total_custom)
         
-        print(f"Estimated monthly cost: ${cost:.2f}")
+        p(f"Estimated monthly cost: ${cost:.2f}")
         
-        print("\nBreakdown by namespace:")
-        for namespace, count in sorted(custom_metrics.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {namespace}: {count} metrics")
+        p("\nBreakdown by namespace:")
+        for namespace, count in sorted(custom_metrics.items(), key=itemgetter(1), reverse=True):
+            p(f"  {namespace}: {count} metrics")
     else:
-        print("No custom metrics found")
+        p("No custom metrics found")
     
     # 2. Analyze Alarms
-    print("\n" + "="*80)
-    print("ALARMS ANALYSIS")
-    print("="*80)
+    p("\n" + "="*80)
+    p("ALARMS ANALYSIS")
+    p("="*80)
     
-    alarm_stats = collector.get_alarm_count()
-    
-    print(f"Total alarms: {alarm_stats['total_alarms']}")
-    print(f"  Standard: {alarm_stats['standard_alarms']} ($0.10/alarm)")
-    print(f"  High-resolution: {alarm_stats['high_resolution_alarms']} ($0.30/alarm)")
-    print(f"  Composite: {alarm_stats['composite_alarms']} ($0.50/alarm)")
+    p(f"Total alarms: {alarm_stats['total_alarms']}")
+    p(f"  Standard: {alarm_stats['standard_alarms']} ($0.10/alarm)")
+    p(f"  High-resolution: {alarm_stats['high_resolution_alarms']} ($0.30/alarm)")
+    p(f"  Composite: {alarm_stats['composite_alarms']} ($0.50/alarm)")
     
     alarm_cost = (
         alarm_stats['standard_alarms'] * 0.10 +
@@ -66,60 +83,55 @@ def analyze_cloudwatch_costs(region: str = 'us-east-1'):
         alarm_stats['composite_alarms'] * 0.50
     )
     
-    print(f"\nEstimated monthly alarm cost: ${alarm_cost:.2f}")
+    p(f"\nEstimated monthly alarm cost: ${alarm_cost:.2f}")
     
     # 3. Analyze Log Groups
-    print("\n" + "="*80)
-    print("LOG GROUPS ANALYSIS")
-    print("="*80)
-    
-    log_groups = collector.get_log_group_metrics()
+    p("\n" + "="*80)
+    p("LOG GROUPS ANALYSIS")
+    p("="*80)
     
     if log_groups:
         total_storage_gb = sum(lg['stored_gb'] for lg in log_groups)
         storage_cost = total_storage_gb * 0.03  # $0.03/GB
         
-        print(f"Total log groups: {len(log_groups)}")
-        print(f"Total storage: {total_storage_gb:.2f} GB")
-        print(f"Estimated monthly storage cost: ${storage_cost:.2f}")
+        p(f"Total log groups: {len(log_groups)}")
+        p(f"Total storage: {total_storage_gb:.2f} GB")
+        p(f"Estimated monthly storage cost: ${storage_cost:.2f}")
         
-        print("\nTop 5 largest log groups:")
-        for i, lg in enumerate(log_groups[:5], 1):
-            print(f"  {i}. {lg['name']}")
-            print(f"     Size: {lg['stored_gb']:.2f} GB")
-            print(f"     Retention: {lg['retention_days']}")
+        p("\nTop 5 largest log groups:")
+        largest = heapq.nlargest(5, log_groups, key=itemgetter('stored_gb'))
+        for i, lg in enumerate(largest, 1):
+            p(f"  {i}. {lg['name']}")
+            p(f"     Size: {lg['stored_gb']:.2f} GB")
+            p(f"     Retention: {lg['retention_days']}")
             
             # Recommendation
             if lg['retention_days'] == 'Never expire':
-                print(f"     ⚠️  RECOMMENDATION: Set retention policy to reduce costs")
+                p(f"     ⚠️  RECOMMENDATION: Set retention policy to reduce costs")
             elif isinstance(lg['retention_days'], int) and lg['retention_days'] > 30:
-                print(f"     💡 Consider reducing retention to 30 days or less")
+                p(f"     💡 Consider reducing retention to 30 days or less")
     else:
-        print("No log groups found")
+        p("No log groups found")
     
     # 4. Summary
-    print("\n" + "="*80)
-    print("COST SUMMARY")
-    print("="*80)
+    p("\n" + "="*80)
+    p("COST SUMMARY")
+    p("="*80)
     
     total_cost = alarm_cost
     
     if total_custom > 0:
-        if total_custom <= 10000:
-            metric_cost = total_custom * 0.30
-        else:
-            metric_cost = (10000 * 0.30) + ((total_custom - 10000) * 0.10)
-        total_cost += metric_cost
+        total_cost += tiered_cost(total_custom)
     
     if log_groups:
         total_cost += storage_cost
     
-    print(f"Estimated total monthly CloudWatch cost: ${total_cost:.2f}")
+    p(f"Estimated total monthly CloudWatch cost: ${total_cost:.2f}")
     
     # Recommendations
-    print("\n" + "="*80)
-    print("COST OPTIMIZATION RECOMMENDATIONS")
-    print("="*80)
+    p("\n" + "="*80)
+    p("COST OPTIMIZATION RECOMMENDATIONS")
+    p("="*80)
     
     recommendations = []
     
@@ -136,10 +148,11 @@ def analyze_cloudwatch_costs(region: str = 'us-east-1'):
     
     if recommendations:
         for i, rec in enumerate(recommendations, 1):
-            print(f"{i}. {rec}")
+            p(f"{i}. {rec}")
     else:
-        print("No major optimization opportunities found. Great job!")
+        p("No major optimization opportunities found. Great job!")
     
+    sys.stdout.write(buf.getvalue())
     logger.info("CloudWatch cost analysis completed")
 
 
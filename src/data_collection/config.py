@@ -9,6 +9,7 @@ MONTHLY_FORECAST_ALERT = 3000.00
 # Data collection intervals
 COST_PULL_FREQUENCY = 'daily'
 METRICS_RETENTION_DAYS = 90
+CE_CACHE_DIR = '~/.cache/aws-cost-optimizer'
 
 # Optimization targets
 MIN_EC2_CPU_UTILIZATION = 40
@@ -0,0 +1,122 @@
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Sub-directory of cache_dir owned by this cache; nothing outside it is touched
+CACHE_SUBDIR = 'ce-responses'
+_DAY_DIR = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+class ResponseCache:
+    """
+    Content-addressed disk cache for Cost Explorer results.
+
+    Entries live in ``<cache_dir>/ce-responses/<UTC day>/``. On the first
+    write of a new day, cache files from earlier days are deleted (and their
+    emptied day directories removed), so the cache only holds today's
+    results. Only files this cache writes are ever deleted.
+    """
+
+    def __init__(self, cache_dir: str, namespace: str = ''):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Parent directory; entries go in its ce-responses/
+                sub-directory
+            namespace: Identity of the data owner (profile or account);
+                part of every key, so owners sharing cache_dir never see
+                each other's entries
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.root = self.cache_dir / CACHE_SUBDIR
+        self.namespace = namespace
+        self._pruned_day: Optional[str] = None
+
+    def _path(self, operation: str, params: Dict) -> Path:
+        """
+        Return the cache file for a request.
+
+        Entries are keyed on a SHA256 of the namespace and request and
+        bucketed by UTC date, so a cached result is reused for the rest of
+        the day only.
+        """
+        request = orjson.dumps(
+            [self.namespace, operation, params], option=orjson.OPT_SORT_KEYS
+        )
+        key = hashlib.sha256(request).hexdigest()
+        return self.root / self._today() / f"{key}.json.gz"
+
+    @staticmethod
+    def _today() -> str:
+        """Return the current UTC date as YYYY-MM-DD."""
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def _prune(self, today: str) -> None:
+        """Delete cache files from days before ``today`` (once per day)."""
+        if self._pruned_day == today:
+            return
+        self._pruned_day = today
+
+        for day_dir in self.root.iterdir():
+            if not (day_dir.is_dir() and _DAY_DIR.fullmatch(day_dir.name)):
+                continue
+            if day_dir.name >= today:
+                continue
+            for entry in day_dir.iterdir():
+                if entry.name.endswith(('.json.gz', '.tmp')):
+                    try:
+                        entry.unlink()
+                    except OSError:
+                        pass  # Best effort; retried on a later day
+            try:
+                day_dir.rmdir()
+            except OSError:
+                pass  # Not empty: holds files this cache didn't write
+
+    def get(self, operation: str, params: Dict) -> Optional[Any]:
+        """Return the cached result for a request, or None on a miss."""
+        path = self._path(operation, params)
+        try:
+            with gzip.open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            # Truncated gzip streams raise EOFError rather than OSError
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def put(self, operation: str, params: Dict, result: Any) -> None:
+        """Store a request's result; failures are logged, never raised."""
+        path = self._path(operation, params)
+        # Unique per writer so concurrent puts never share a temp file
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._prune(path.parent.name)
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(result))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            # TypeError covers orjson.JSONEncodeError for unserializable data
+            logger.warning("Failed to write cache entry %s: %s", path, e)
+        finally:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass  # Already renamed into place
+            except OSError as e:
+                logger.warning("Failed to remove %s: %s", tmp_path, e)
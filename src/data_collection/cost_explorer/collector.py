@@ -1,6 +1,13 @@
-import boto3
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import copy
+import functools
+import orjson
+import threading
+from collections import defaultdict
+from cachetools import TTLCache
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
 import logging
 
 from src.data_collection.config import (
@@ -8,17 +15,212 @@ from src.data_collection.config import (
     AWS_REGIONS,
     COST_PULL_FREQUENCY
 )
+from src.data_collection.cost_explorer.cache import ResponseCache
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
+# boto3/botocore are imported on first client creation rather than at module
+# import; they dominate import time.
+
+# Fixed parts of each GetCostAndUsage request, merged per call with
+# {**TEMPLATE, 'TimePeriod': ...}. The top level and sequences are immutable;
+# the GroupBy entries stay plain dicts because botocore only accepts dict for
+# structure members, so they are shared and must never be modified.
+DAILY_COSTS_REQUEST = MappingProxyType({
+    'Metrics': ('UnblendedCost', 'UsageQuantity'),
+    'GroupBy': ({'Type': 'DIMENSION', 'Key': 'SERVICE'},)
+})
+SERVICE_COSTS_REQUEST = MappingProxyType({
+    'Granularity': 'MONTHLY',
+    'Metrics': ('UnblendedCost',),
+    'GroupBy': ({'Type': 'DIMENSION', 'Key': 'SERVICE'},)
+})
+USAGE_BY_TYPE_REQUEST = MappingProxyType({
+    'Granularity': 'MONTHLY',
+    'Metrics': ('UnblendedCost', 'UsageQuantity'),
+    'GroupBy': ({'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'},)
+})
+TAGGED_COSTS_REQUEST = MappingProxyType({
+    'Granularity': 'MONTHLY',
+    'Metrics': ('UnblendedCost',)
+})
+
+
+@functools.lru_cache(maxsize=None)
+def default_client_config() -> 'Config':
+    """Pooled, keep-alive connections with adaptive retries for throttled APIs."""
+    from botocore.config import Config
+    
+    return Config(
+        max_pool_connections=32,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=30
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _iso_date(day: date, offset_days: int = 0) -> str:
+    """Return ``day`` shifted by ``offset_days`` as a YYYY-MM-DD string."""
+    return (day + timedelta(days=offset_days)).isoformat()
+
+
+@functools.lru_cache(maxsize=8)
+def _ce_client(profile_name: str):
+    """Return a Cost Explorer client shared by every collector on this profile."""
+    import boto3
+    
+    session = boto3.Session(profile_name=profile_name)
+    return session.client(
+        'ce',
+        region_name='us-east-1',  # CE is global
+        config=default_client_config()
+    )
+
 
 class CostExplorerCollector:
     """Collects cost and usage data from AWS Cost Explorer API."""
     
-    def __init__(self, profile_name: str = AWS_PROFILE):
-        """Initialize Cost Explorer client."""
-        session = boto3.Session(profile_name=profile_name)
-        self.client = session.client('ce', region_name='us-east-1')  # CE is global
+    def __init__(
+        self,
+        profile_name: str = AWS_PROFILE,
+        cache_ttl: Optional[int] = None,
+        disk_cache_dir: Optional[str] = None,
+        session: Optional['boto3.Session'] = None,
+        botocore_config: Optional['Config'] = None
+    ):
+        """
+        Initialize Cost Explorer client.
+        
+        Args:
+            profile_name: AWS profile to load credentials from
+            cache_ttl: Seconds to reuse identical Cost Explorer responses
+                (e.g. 3600). Caching is disabled when None.
+            disk_cache_dir: Directory for persisting GetCostAndUsage results
+                across runs for the rest of the UTC day (e.g.
+                config.CE_CACHE_DIR). Entries are scoped to the profile, or
+                to the account of an injected session, so collectors for
+                different accounts can share it. Disabled when None.
+            session: Shared boto3 session; pass the same one to every
+                collector to reuse credentials and connections
+            botocore_config: Client config (defaults to default_client_config())
+        """
+        injected_session = session
+        if session is None and botocore_config is None:
+            self.client = _ce_client(profile_name)
+        else:
+            import boto3
+            
+            session = session or boto3.Session(profile_name=profile_name)
+            self.client = session.client(
+                'ce',
+                region_name='us-east-1',  # CE is global
+                config=botocore_config or default_client_config()
+            )
+        self._cache = TTLCache(maxsize=256, ttl=cache_ttl) if cache_ttl else None
+        self._cache_lock = threading.Lock()  # TTLCache is not thread-safe
+        
+        self._disk_cache = None
+        if disk_cache_dir:
+            namespace = self._cache_namespace(profile_name, injected_session)
+            if namespace is not None:
+                self._disk_cache = ResponseCache(disk_cache_dir, namespace)
+        
+    @staticmethod
+    def _cache_namespace(
+        profile_name: str,
+        session: Optional['boto3.Session']
+    ) -> Optional[str]:
+        """
+        Identify whose cost data this collector reads, for disk cache keys.
+        
+        An injected session's credentials may not come from a named profile,
+        so it is identified by its STS account id. Returns None (disabling
+        the disk cache) if that lookup fails.
+        """
+        if session is None:
+            return f"profile:{profile_name}"
+        
+        try:
+            sts = session.client('sts', region_name='us-east-1')
+            return f"account:{sts.get_caller_identity()['Account']}"
+        except Exception as e:
+            logger.warning("Disk cache disabled; could not resolve account: %s", e)
+            return None
+        
+        
+    def _call_api(self, operation: str, **params: Any) -> Dict:
+        """
+        Invoke a Cost Explorer operation, serving repeats from the TTL cache.
+        
+        Cost Explorer bills every request, so identical requests made within
+        ``cache_ttl`` seconds are answered from memory. Callers always get a
+        deep copy, so mutating a result never alters the cached response.
+        """
+        if self._cache is None:
+            return getattr(self.client, operation)(**params)
+        
+        key = (operation, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        with self._cache_lock:
+            response = self._cache.get(key)
+        
+        if response is None:
+            # Call outside the lock so concurrent requests aren't serialized
+            response = getattr(self.client, operation)(**params)
+            with self._cache_lock:
+                self._cache[key] = response
+        return copy.deepcopy(response)
+        
+    def _paginate_cost_and_usage(self, **params: Any) -> Iterator[Dict]:
+        """
+        Yield every ResultsByTime entry of a GetCostAndUsage request.
+        
+        When the disk cache is enabled, a request already answered today is
+        replayed from disk instead of being billed again. Ranges ending today
+        or later are still accruing costs, so they always go to the API.
+        """
+        if self._disk_cache is None or not self._is_settled(params):
+            yield from self._fetch_cost_and_usage_pages(params)
+            return
+        
+        results = self._disk_cache.get('get_cost_and_usage', params)
+        if results is None:
+            results = list(self._fetch_cost_and_usage_pages(dict(params)))
+            self._disk_cache.put('get_cost_and_usage', params, results)
+        yield from results
+        
+    @staticmethod
+    def _is_settled(params: Dict) -> bool:
+        """Return True if a request's TimePeriod ends before today."""
+        try:
+            end = date.fromisoformat(params['TimePeriod']['End'][:10])
+        except (KeyError, TypeError, ValueError):
+            return False
+        # The cache is bucketed by UTC day; use whichever "today" comes first
+        today = min(date.today(), datetime.now(timezone.utc).date())
+        return end < today
+
+    def _fetch_cost_and_usage_pages(self, params: Dict) -> Iterator[Dict]:
+        """
+        Yield ResultsByTime entries from every page of a GetCostAndUsage call.
+        
+        Cost Explorer has no botocore paginator, so this follows
+        NextPageToken until the last page instead of silently keeping only
+        the first one.
+        """
+        while True:
+            response = self._call_api('get_cost_and_usage', **params)
+            yield from response.get('ResultsByTime', [])
+            
+            next_token = response.get('NextPageToken')
+            if not next_token:
+                break
+            params['NextPageToken'] = next_token
         
     def get_daily_costs(
         self, 
@@ -37,29 +239,26 @@ class CostExplorerCollector:
         Returns:
             Dictionary containing cost data with timestamps
         """
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        today = date.today()
+        start_date = start_date or _iso_date(today, -30)
+        end_date = end_date or _iso_date(today)
             
         try:
-            response = self.client.get_cost_and_usage(
+            results = self._paginate_cost_and_usage(
+                **DAILY_COSTS_REQUEST,
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
                 },
-                Granularity=granularity,
-                Metrics=['UnblendedCost', 'UsageQuantity'],
-                GroupBy=[
-                    {'Type': 'DIMENSION', 'Key': 'SERVICE'}
-                ]
+                Granularity=granularity
             )
             
-            logger.info(f"Retrieved cost data from {start_date} to {end_date}")
-            return self._parse_cost_response(response)
+            parsed_data = self._parse_cost_response(results)
+            logger.info("Retrieved cost data from %s to %s", start_date, end_date)
+            return parsed_data
             
         except Exception as e:
-            logger.error(f"Failed to retrieve cost data: {str(e)}")
+            logger.error("Failed to retrieve cost data: %s", e)
             raise
     
     def get_service_costs(
@@ -73,28 +272,23 @@ class CostExplorerCollector:
         Returns:
             List of dictionaries with service name and total cost
         """
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        today = date.today()
+        start_date = start_date or _iso_date(today, -7)
+        end_date = end_date or _iso_date(today)
             
         try:
-            response = self.client.get_cost_and_usage(
+            results = self._paginate_cost_and_usage(
+                **SERVICE_COSTS_REQUEST,
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['UnblendedCost'],
-                GroupBy=[
-                    {'Type': 'DIMENSION', 'Key': 'SERVICE'}
-                ]
+                }
             )
             
-            return self._aggregate_service_costs(response)
+            return self._aggregate_service_costs(results)
             
         except Exception as e:
-            logger.error(f"Failed to retrieve service costs: {str(e)}")
+            logger.error("Failed to retrieve service costs: %s", e)
             raise
     
     def get_usage_by_type(
@@ -114,34 +308,29 @@ class CostExplorerCollector:
         Returns:
             Dictionary with usage types and costs
         """
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        today = date.today()
+        start_date = start_date or _iso_date(today, -30)
+        end_date = end_date or _iso_date(today)
             
         try:
-            response = self.client.get_cost_and_usage(
+            results = self._paginate_cost_and_usage(
+                **USAGE_BY_TYPE_REQUEST,
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
                 },
-                Granularity='MONTHLY',
-                Metrics=['UnblendedCost', 'UsageQuantity'],
                 Filter={
                     'Dimensions': {
                         'Key': 'SERVICE',
                         'Values': [service_name]
                     }
-                },
-                GroupBy=[
-                    {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
-                ]
+                }
             )
             
-            return self._parse_usage_types(response)
+            return self._parse_usage_types(results)
             
         except Exception as e:
-            logger.error(f"Failed to retrieve usage types for {service_name}: {str(e)}")
+            logger.error("Failed to retrieve usage types for %s: %s", service_name, e)
             raise
     
     def get_tagged_resources_cost(
@@ -163,22 +352,20 @@ class CostExplorerCollector:
         Returns:
             Dictionary with tag values and associated costs
         """
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        today = date.today()
+        start_date = start_date or _iso_date(today, -30)
+        end_date = end_date or _iso_date(today)
             
         try:
             params = {
+                **TAGGED_COSTS_REQUEST,
                 'TimePeriod': {
                     'Start': start_date,
                     'End': end_date
                 },
-                'Granularity': 'MONTHLY',
-                'Metrics': ['UnblendedCost'],
-                'GroupBy': [
-                    {'Type': 'TAG', 'Key': tag_key}
-                ]
+                'GroupBy': (
+                    {'Type': 'TAG', 'Key': tag_key},
+                )
             }
             
             # Add filter for specific tag values if provided
@@ -190,11 +377,11 @@ class CostExplorerCollector:
                     }
                 }
             
-            response = self.client.get_cost_and_usage(**params)
-            return self._parse_tagged_costs(response, tag_key)
+            results = self._paginate_cost_and_usage(**params)
+            return self._parse_tagged_costs(results, tag_key)
             
         except Exception as e:
-            logger.error(f"Failed to retrieve tagged resource costs: {str(e)}")
+            logger.error("Failed to retrieve tagged resource costs: %s", e)
             raise
     
     def get_forecast(
@@ -212,11 +399,13 @@ class CostExplorerCollector:
         Returns:
             Dictionary with forecasted costs
         """
-        start_date = datetime.now().strftime('%Y-%m-%d')
-        end_date = (datetime.now() + timedelta(days=forecast_days)).strftime('%Y-%m-%d')
+        today = date.today()
+        start_date = _iso_date(today)
+        end_date = _iso_date(today, forecast_days)
         
         try:
-            response = self.client.get_cost_forecast(
+            response = self._call_api(
+                'get_cost_forecast',
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
@@ -232,58 +421,47 @@ class CostExplorerCollector:
             }
             
         except Exception as e:
-            logger.error(f"Failed to retrieve cost forecast: {str(e)}")
+            logger.error("Failed to retrieve cost forecast: %s", e)
             raise
     
-    def _parse_cost_response(self, response: Dict) -> Dict:
-        """Parse raw Cost Explorer response into structured format."""
-        parsed_data = {
-            'time_period': response.get('ResultsByTime', []),
-            'total_cost': 0.0,
-            'by_service': {}
-        }
+    def _service_cost_totals(self, results: Iterable[Dict]) -> Dict[str, float]:
+        """Sum UnblendedCost per service across all ResultsByTime entries."""
+        by_service = defaultdict(float)
         
-        for result in response.get('ResultsByTime', []):
+        for result in results:
             for group in result.get('Groups', []):
-                service_name = group['Keys'][0]
-                cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                
-                if service_name not in parsed_data['by_service']:
-                    parsed_data['by_service'][service_name] = 0.0
-                
-                parsed_data['by_service'][service_name] += cost
-                parsed_data['total_cost'] += cost
+                service = group['Keys'][0]
+                by_service[service] += float(group['Metrics']['UnblendedCost']['Amount'])
         
-        return parsed_data
+        return dict(by_service)
     
-    def _aggregate_service_costs(self, response: Dict) -> List[Dict]:
-        """Aggregate costs by service and sort by highest cost."""
-        service_costs = {}
+    def _parse_cost_response(self, results: Iterable[Dict]) -> Dict:
+        """Parse Cost Explorer ResultsByTime entries into structured format."""
+        results = list(results)
+        by_service = self._service_cost_totals(results)
         
-        for result in response.get('ResultsByTime', []):
-            for group in result.get('Groups', []):
-                service_name = group['Keys'][0]
-                cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                
-                if service_name not in service_costs:
-                    service_costs[service_name] = 0.0
-                
-                service_costs[service_name] += cost
+        return {
+            'time_period': results,
+            'total_cost': sum(by_service.values()),
+            'by_service': by_service
+        }
+    
+    def _aggregate_service_costs(self, results: Iterable[Dict]) -> List[Dict]:
+        """Aggregate costs by service and sort by highest cost."""
+        by_service = self._service_cost_totals(results)
         
         # Sort by cost descending
-        sorted_services = sorted(
-            [{'service': k, 'cost': v} for k, v in service_costs.items()],
-            key=lambda x: x['cost'],
+        return sorted(
+            [{'service': service, 'cost': cost} for service, cost in by_service.items()],
+            key=itemgetter('cost'),
             reverse=True
         )
-        
-        return sorted_services
     
-    def _parse_usage_types(self, response: Dict) -> Dict:
+    def _parse_usage_types(self, results: Iterable[Dict]) -> Dict:
         """Parse usage type breakdown for detailed analysis."""
         usage_data = {}
         
-        for result in response.get('ResultsByTime', []):
+        for result in results:
             for group in result.get('Groups', []):
                 usage_type = group['Keys'][0]
                 cost = float(group['Metrics']['UnblendedCost']['Amount'])
@@ -297,24 +475,23 @@ class CostExplorerCollector:
         
         return usage_data
     
-    def _parse_tagged_costs(self, response: Dict, tag_key: str) -> Dict:
+    def _parse_tagged_costs(self, results: Iterable[Dict], tag_key: str) -> Dict:
         """Parse costs grouped by tag values."""
-        tagged_costs = {
-            'tag_key': tag_key,
-            'by_tag_value': {},
-            'untagged_cost': 0.0
-        }
+        by_tag_value = defaultdict(float)
+        untagged_cost = 0.0
         
-        for result in response.get('ResultsByTime', []):
+        for result in results:
             for group in result.get('Groups', []):
                 tag_value = group['Keys'][0] if group['Keys'] else 'untagged'
                 cost = float(group['Metrics']['UnblendedCost']['Amount'])
                 
                 if tag_value == 'untagged' or tag_value == '':
-                    tagged_costs['untagged_cost'] += cost
+                    untagged_cost += cost
                 else:
-                    if tag_value not in tagged_costs['by_tag_value']:
-                        tagged_costs['by_tag_value'][tag_value] = 0.0
-                    tagged_costs['by_tag_value'][tag_value] += cost
+                    by_tag_value[tag_value] += cost
         
-        return tagged_costs
\ No newline at end of file
+        return {
+            'tag_key': tag_key,
+            'by_tag_value': dict(by_tag_value),
+            'untagged_cost': untagged_cost
+        }
\ No newline at end of file
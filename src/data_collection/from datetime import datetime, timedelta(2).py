@@ -2,11 +2,20 @@ from datetime import datetime, timedelta
 
 # Simulated metric collector for demonstration purposes
 class MetricCollector:
-    def get_metric_statistics(self, namespace, metric_name, dimensions, start_time, end_time, period):
-        # Simulated data for demonstration
+    def get_metric_data(self, metric_data_queries, start_time, end_time, next_token=None):
+        # Simulated GetMetricData response: one result per query Id, single page
+        simulated_values = {
+            'Average': [35.0],  # Example average CPU utilization
+            'Maximum': [70.0]   # Example maximum CPU utilization
+        }
         return {
-            'average': 35.0,  # Example average CPU utilization
-            'maximum': 70.0   # Example maximum CPU utilization
+            'MetricDataResults': [
+                {
+                    'Id': query['Id'],
+                    'Values': simulated_values[query['MetricStat']['Stat']]
+                }
+                for query in metric_data_queries
+            ]
         }
 
 # Initialize the metric collector
@@ -19,24 +28,70 @@ resources = [
     ('i-003', 'EC2 Instance 3')
 ]
 
+# Build one GetMetricData batch instead of a call per instance
+# (each request accepts up to 500 queries)
+queries = []
+for i, (instance_id, _) in enumerate(resources):
+    for stat, prefix in (('Average', 'avg'), ('Maximum', 'max')):
+        queries.append({
+            'Id': f'{prefix}{i}',
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': 'AWS/EC2',
+                    'MetricName': 'CPUUtilization',
+                    'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                },
+                'Period': 86400,  # Daily averages
+                'Stat': stat
+            }
+        })
+
+end_time = datetime.now()
+start_time = end_time - timedelta(days=14)
+
+values_by_id = {}
+for batch_start in range(0, len(queries), 500):
+    batch = queries[batch_start:batch_start + 500]
+    next_token = None
+    # A batch's datapoints can span several pages; follow NextToken to the end
+    while True:
+        response = collector.get_metric_data(
+            metric_data_queries=batch,
+            start_time=start_time,
+            end_time=end_time,
+            next_token=next_token
+        )
+        for result in response['MetricDataResults']:
+            values_by_id.setdefault(result['Id'], []).extend(result['Values'])
+
+        next_token = response.get('NextToken')
+        if not next_token:
+            break
+
 print("Resource Utilization Summary:")
 print("-" * 80)
 
-for instance_id, name in resources:
-    metrics = collector.get_metric_statistics(
-        namespace='AWS/EC2',
-        metric_name='CPUUtilization',
-        dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-        start_time=datetime.now() - timedelta(days=14),
-        end_time=datetime.now(),
-        period=86400  # Daily averages
-    )
-    
+for i, (instance_id, name) in enumerate(resources):
+    daily_averages = values_by_id.get(f'avg{i}', [])
+    daily_maximums = values_by_id.get(f'max{i}', [])
+    if not daily_averages:
+        print(f"{name} ({instance_id}): no datapoints")
+        print()
+        continue
+
+    metrics = {
+        'average': sum(daily_averages) / len(daily_averages),
+        'maximum': max(daily_maximums) if daily_maximums else None
+    }
+
     print(f"{name} ({instance_id}):")
     print(f"  Average CPU: {metrics['average']:.2f}%")
-    print(f"  Maximum CPU: {metrics['maximum']:.2f}%")
-    
+    if metrics['maximum'] is None:
+        print("  Maximum CPU: n/a")
+    else:
+        print(f"  Maximum CPU: {metrics['maximum']:.2f}%")
+
     # Rightsizing recommendation
     if metrics['average'] < 40:
         print(f"  ⚠️  RECOMMENDATION: Consider downsizing (low utilization)")
-    print()
\ No newline at end of file
+    print()
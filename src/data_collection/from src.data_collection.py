@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from src.data_collection.cost_explorer.collector import CostExplorerCollector
 from src.data_collection.cloudwatch.collector import CloudWatchCollector
 
@@ -5,12 +7,18 @@ from src.data_collection.cloudwatch.collector import CloudWatchCollector
 ce_collector = CostExplorerCollector()
 cw_collector = CloudWatchCollector()
 
-# Get actual CloudWatch costs from Cost Explorer
-cloudwatch_costs = ce_collector.get_usage_by_type(
-    service_name='Amazon CloudWatch',
-    start_date='2026-01-01',
-    end_date='2026-01-31'
-)
+# Fetch actual costs (Cost Explorer) and the metric count (CloudWatch)
+# concurrently; the two calls are independent
+with ThreadPoolExecutor(max_workers=2) as executor:
+    costs_future = executor.submit(
+        ce_collector.get_usage_by_type,
+        service_name='Amazon CloudWatch',
+        start_date='2026-01-01',
+        end_date='2026-01-31'
+    )
+    metrics_future = executor.submit(cw_collector.get_custom_metric_count)
+    cloudwatch_costs = costs_future.result()
+    custom_metrics = metrics_future.result()
 
 print("Actual CloudWatch costs by usage type:")
 for usage_type, data in cloudwatch_costs.items():
@@ -19,7 +27,6 @@ for usage_type, data in cloudwatch_costs.items():
     print(f"    Unit cost: ${data['unit_cost']:.4f}")
 
 # Compare with projections from collector analysis
-custom_metrics = cw_collector.get_custom_metric_count()
 total_custom = sum(custom_metrics.values())
 
 print(f"\nCustom metric count: {total_custom}")
@@ -0,0 +1,37 @@
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# CloudWatch custom metrics: first 10,000 at $0.30/metric, the rest at $0.10
+CUSTOM_METRIC_TIERS = ((10000, 0.30), (None, 0.10))
+
+
+def tiered_cost(
+    count: Union[float, Sequence[float], np.ndarray],
+    tiers: Sequence[Tuple[Optional[int], float]] = CUSTOM_METRIC_TIERS
+) -> Union[float, np.ndarray]:
+    """
+    Price a usage count against tiered per-unit rates.
+
+    Args:
+        count: Units used; a scalar or an array of counts to price at once
+        tiers: (tier_size, rate) pairs in order; a tier_size of None covers
+            everything above the previous tiers
+
+    Returns:
+        Total cost as a float for scalar input, otherwise an array;
+        negative counts cost nothing
+    """
+    count = np.asarray(count, dtype=np.float64)
+    total = np.zeros_like(count)
+    used = 0
+
+    for tier_size, rate in tiers:
+        remaining = np.maximum(count - used, 0)
+        if tier_size is None:
+            total += remaining * rate
+            break
+        total += np.minimum(remaining, tier_size) * rate
+        used += tier_size
+
+    return float(total) if total.ndim == 0 else total
@@ -0,0 +1,145 @@
+import gzip
+from unittest import mock
+
+import pytest
+
+from src.data_collection.cost_explorer import cache as cache_module
+from src.data_collection.cost_explorer.cache import ResponseCache
+
+PARAMS = {
+    'TimePeriod': {'Start': '2026-01-01', 'End': '2026-01-31'},
+    'Granularity': 'MONTHLY',
+    'Metrics': ['UnblendedCost']
+}
+RESULTS = [{'TimePeriod': PARAMS['TimePeriod'], 'Groups': []}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path))
+
+
+def _entry_path(cache, params=PARAMS):
+    return cache._path('get_cost_and_usage', params)
+
+
+def test_miss_returns_none(cache):
+    assert cache.get('get_cost_and_usage', PARAMS) is None
+
+
+def test_hit_returns_stored_result(cache):
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    assert cache.get('get_cost_and_usage', PARAMS) == RESULTS
+
+
+def test_key_ignores_param_order(cache):
+    reordered = dict(reversed(list(PARAMS.items())))
+
+    assert _entry_path(cache, reordered) == _entry_path(cache)
+
+
+def test_different_params_use_different_keys(cache):
+    other = {**PARAMS, 'Granularity': 'DAILY'}
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    assert _entry_path(cache, other) != _entry_path(cache)
+    assert cache.get('get_cost_and_usage', other) is None
+    assert cache._path('get_cost_forecast', PARAMS) != _entry_path(cache)
+
+
+def test_truncated_entry_is_a_miss(cache):
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+    path = _entry_path(cache)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    assert cache.get('get_cost_and_usage', PARAMS) is None
+
+
+def test_corrupt_entry_is_a_miss(cache):
+    path = _entry_path(cache)
+    path.parent.mkdir(parents=True)
+    with gzip.open(path, 'wb') as f:
+        f.write(b'{not json')
+
+    assert cache.get('get_cost_and_usage', PARAMS) is None
+
+
+def test_non_gzip_entry_is_a_miss(cache):
+    path = _entry_path(cache)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b'plain bytes')
+
+    assert cache.get('get_cost_and_usage', PARAMS) is None
+
+
+def test_put_writes_atomically(cache):
+    path = _entry_path(cache)
+    path.parent.mkdir(parents=True)
+
+    with mock.patch.object(cache_module.os, 'replace', wraps=cache_module.os.replace) as replace:
+        cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    src, dst = replace.call_args.args
+    assert str(dst) == str(path)
+    assert str(src).endswith('.tmp')
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_failed_replace_keeps_old_entry_and_removes_temp(cache):
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+    path = _entry_path(cache)
+
+    with mock.patch.object(cache_module.os, 'replace', side_effect=OSError('disk full')):
+        cache.put('get_cost_and_usage', PARAMS, [{'Groups': ['new']}])
+
+    assert cache.get('get_cost_and_usage', PARAMS) == RESULTS
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_unserializable_result_is_logged_not_raised(cache):
+    cache.put('get_cost_and_usage', PARAMS, [object()])
+
+    path = _entry_path(cache)
+    assert cache.get('get_cost_and_usage', PARAMS) is None
+    assert list(path.parent.iterdir()) == []
+
+
+def test_put_prunes_previous_days(cache):
+    old_day = cache.root / '2000-01-01'
+    old_day.mkdir(parents=True)
+    (old_day / 'stale.json.gz').write_bytes(b'')
+
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    assert not old_day.exists()
+    assert cache.get('get_cost_and_usage', PARAMS) == RESULTS
+
+
+def test_prune_never_touches_directories_outside_its_subdir(cache, tmp_path):
+    # Dated folders the user owns next to the cache, in both ISO formats
+    owned = [tmp_path / '2000-01-01', tmp_path / '20200101']
+    for folder in owned:
+        folder.mkdir()
+        (folder / 'report.json.gz').write_bytes(b'keep')
+
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    for folder in owned:
+        assert (folder / 'report.json.gz').read_bytes() == b'keep'
+
+
+def test_prune_keeps_foreign_files_in_old_day_dirs(cache):
+    old_day = cache.root / '2000-01-01'
+    old_day.mkdir(parents=True)
+    (old_day / 'stale.json.gz').write_bytes(b'')
+    (old_day / 'notes.txt').write_bytes(b'keep')
+    not_a_day = cache.root / '20000101'
+    not_a_day.mkdir()
+    (not_a_day / 'x.json.gz').write_bytes(b'')
+
+    cache.put('get_cost_and_usage', PARAMS, RESULTS)
+
+    assert sorted(p.name for p in old_day.iterdir()) == ['notes.txt']
+    assert (not_a_day / 'x.json.gz').exists()
@@ -0,0 +1,208 @@
+import copy
+from datetime import date, timedelta
+from unittest import mock
+
+import pytest
+
+from src.data_collection.cost_explorer import collector as collector_module
+from src.data_collection.cost_explorer.collector import CostExplorerCollector
+
+
+def _group(key, cost, quantity='1'):
+    return {
+        'Keys': [key],
+        'Metrics': {
+            'UnblendedCost': {'Amount': cost, 'Unit': 'USD'},
+            'UsageQuantity': {'Amount': quantity, 'Unit': 'N/A'}
+        }
+    }
+
+
+FIRST_PAGE = {
+    'ResultsByTime': [{'Groups': [_group('AmazonEC2', '1.5'), _group('AmazonS3', '2')]}],
+    'NextPageToken': 'page-2'
+}
+SECOND_PAGE = {
+    'ResultsByTime': [{'Groups': [_group('AmazonEC2', '1.0')]}]
+}
+
+
+def _two_page_client():
+    client = mock.Mock()
+
+    def get_cost_and_usage(**params):
+        return SECOND_PAGE if params.get('NextPageToken') == 'page-2' else FIRST_PAGE
+
+    client.get_cost_and_usage.side_effect = get_cost_and_usage
+    return client
+
+
+@pytest.fixture
+def client():
+    return _two_page_client()
+
+
+@pytest.fixture
+def make_collector(client):
+    def make(**kwargs):
+        with mock.patch.object(collector_module, '_ce_client', return_value=client):
+            return CostExplorerCollector(**kwargs)
+    return make
+
+
+PARAMS = {
+    'TimePeriod': {'Start': '2026-01-01', 'End': '2026-01-31'},
+    'Granularity': 'MONTHLY',
+    'Metrics': ['UnblendedCost']
+}
+
+
+def test_paginate_consumes_every_page(make_collector, client):
+    collector = make_collector()
+
+    results = list(collector._paginate_cost_and_usage(**PARAMS))
+
+    assert results == FIRST_PAGE['ResultsByTime'] + SECOND_PAGE['ResultsByTime']
+    assert client.get_cost_and_usage.call_count == 2
+
+
+def test_paginate_forwards_next_page_token(make_collector, client):
+    collector = make_collector()
+
+    list(collector._paginate_cost_and_usage(**PARAMS))
+
+    first_call, second_call = client.get_cost_and_usage.call_args_list
+    assert 'NextPageToken' not in first_call.kwargs
+    assert second_call.kwargs == {**PARAMS, 'NextPageToken': 'page-2'}
+
+
+def test_getters_aggregate_across_pages(make_collector):
+    collector = make_collector()
+
+    daily = collector.get_daily_costs('2026-01-01', '2026-01-31')
+    services = collector.get_service_costs('2026-01-01', '2026-01-31')
+
+    assert daily['by_service'] == {'AmazonEC2': 2.5, 'AmazonS3': 2.0}
+    assert daily['total_cost'] == pytest.approx(4.5)
+    assert services == [
+        {'service': 'AmazonEC2', 'cost': 2.5},
+        {'service': 'AmazonS3', 'cost': 2.0}
+    ]
+
+
+def test_service_totals_keep_first_seen_order_and_stable_ties(make_collector):
+    collector = make_collector()
+    results = [{'Groups': [_group('AmazonS3', '1'), _group('AmazonEC2', '1'), _group('AWSLambda', '3')]}]
+
+    assert list(collector._parse_cost_response(results)['by_service']) == [
+        'AmazonS3', 'AmazonEC2', 'AWSLambda'
+    ]
+    assert [row['service'] for row in collector._aggregate_service_costs(results)] == [
+        'AWSLambda', 'AmazonS3', 'AmazonEC2'
+    ]
+
+
+def test_disk_cache_does_not_mutate_params_and_replays(make_collector, client, tmp_path):
+    collector = make_collector(disk_cache_dir=str(tmp_path))
+    params = copy.deepcopy(PARAMS)
+
+    first = list(collector._paginate_cost_and_usage(**params))
+    assert params == PARAMS
+
+    # The entry is keyed on the caller's params, without NextPageToken
+    assert collector._disk_cache.get('get_cost_and_usage', PARAMS) == first
+
+    second = list(collector._paginate_cost_and_usage(**params))
+    assert second == first
+    assert client.get_cost_and_usage.call_count == 2
+
+
+@pytest.mark.parametrize('end_offset', [0, 1])
+def test_disk_cache_skipped_for_ranges_still_accruing(make_collector, client, tmp_path, end_offset):
+    collector = make_collector(disk_cache_dir=str(tmp_path))
+    today = date.today()
+    start = (today - timedelta(days=7)).isoformat()
+    end = (today + timedelta(days=end_offset)).isoformat()
+
+    collector.get_service_costs(start, end)
+    collector.get_service_costs(start, end)
+
+    assert client.get_cost_and_usage.call_count == 4  # two pages, twice
+    assert not (tmp_path / 'ce-responses').exists()
+
+
+def test_ttl_cache_reuses_responses(make_collector, client):
+    collector = make_collector(cache_ttl=3600)
+
+    first = collector.get_service_costs('2026-01-01', '2026-01-31')
+    second = collector.get_service_costs('2026-01-01', '2026-01-31')
+
+    assert first == second
+    assert client.get_cost_and_usage.call_count == 2  # one per page, once
+
+
+def test_ttl_cache_hits_are_isolated_from_caller_mutation(make_collector):
+    collector = make_collector(cache_ttl=3600)
+
+    first = collector.get_daily_costs('2026-01-01', '2026-01-31')
+    first['time_period'][0]['Groups'].clear()
+    second = collector.get_daily_costs('2026-01-01', '2026-01-31')
+
+    assert second['by_service'] == {'AmazonEC2': 2.5, 'AmazonS3': 2.0}
+    assert second['time_period'][0]['Groups']
+
+
+def _single_page_client(cost):
+    client = mock.Mock()
+    client.get_cost_and_usage.return_value = {
+        'ResultsByTime': [{'Groups': [_group('AmazonEC2', cost)]}]
+    }
+    return client
+
+
+def test_disk_cache_is_scoped_per_profile(tmp_path):
+    clients = {'prod': _single_page_client('1000'), 'dev': _single_page_client('5')}
+    with mock.patch.object(collector_module, '_ce_client', side_effect=clients.get):
+        prod = CostExplorerCollector('prod', disk_cache_dir=str(tmp_path))
+        dev = CostExplorerCollector('dev', disk_cache_dir=str(tmp_path))
+
+    prod_costs = prod.get_service_costs('2026-01-01', '2026-01-31')
+    dev_costs = dev.get_service_costs('2026-01-01', '2026-01-31')
+
+    assert prod_costs == [{'service': 'AmazonEC2', 'cost': 1000.0}]
+    assert dev_costs == [{'service': 'AmazonEC2', 'cost': 5.0}]
+    assert clients['dev'].get_cost_and_usage.call_count == 1
+
+
+def _session_for_account(account, ce_client):
+    sts = mock.Mock()
+    sts.get_caller_identity.return_value = {'Account': account}
+    session = mock.Mock()
+    session.client.side_effect = lambda name, **kwargs: sts if name == 'sts' else ce_client
+    return session
+
+
+def test_disk_cache_is_scoped_per_injected_session_account(tmp_path):
+    first_client, second_client = _single_page_client('1000'), _single_page_client('5')
+    first = CostExplorerCollector(
+        disk_cache_dir=str(tmp_path), session=_session_for_account('111111111111', first_client)
+    )
+    second = CostExplorerCollector(
+        disk_cache_dir=str(tmp_path), session=_session_for_account('222222222222', second_client)
+    )
+
+    first.get_service_costs('2026-01-01', '2026-01-31')
+    second_costs = second.get_service_costs('2026-01-01', '2026-01-31')
+
+    assert second_costs == [{'service': 'AmazonEC2', 'cost': 5.0}]
+    assert second_client.get_cost_and_usage.call_count == 1
+
+
+def test_disk_cache_disabled_when_account_lookup_fails(tmp_path):
+    session = _session_for_account('111111111111', _single_page_client('1'))
+    session.client.side_effect = None
+    session.client.return_value.get_caller_identity.side_effect = RuntimeError('no creds')
+
+    collector = CostExplorerCollector(disk_cache_dir=str(tmp_path), session=session)
+
+    assert collector._disk_cache is None
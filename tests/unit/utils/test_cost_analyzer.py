@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from src.utils.cost_analyzer import tiered_cost
+
+
+def _inline_custom_metric_cost(total_custom):
+    """The if/else formula tiered_cost replaced in the CloudWatch scripts."""
+    if total_custom <= 10000:
+        return total_custom * 0.30
+    return (10000 * 0.30) + ((total_custom - 10000) * 0.10)
+
+
+@pytest.mark.parametrize('count', [0, 1, 9999, 10000, 10001, 25000])
+def test_scalar_matches_inline_formula(count):
+    cost = tiered_cost(count)
+
+    assert isinstance(cost, float)
+    assert cost == pytest.approx(_inline_custom_metric_cost(count))
+
+
+def test_array_matches_inline_formula():
+    counts = [0, 500, 10000, 12000, 150000]
+
+    costs = tiered_cost(counts)
+
+    assert isinstance(costs, np.ndarray)
+    np.testing.assert_allclose(
+        costs, [_inline_custom_metric_cost(c) for c in counts]
+    )
+
+
+def test_negative_counts_cost_nothing():
+    # The inline formula returned a negative cost here; counts can't be negative
+    assert tiered_cost(-5) == 0.0
+    np.testing.assert_array_equal(tiered_cost([-1, 0]), [0.0, 0.0])
+
+
+def test_custom_tiers():
+    tiers = ((10, 1.0), (10, 0.5), (None, 0.1))
+
+    assert tiered_cost(25, tiers) == pytest.approx(10 * 1.0 + 10 * 0.5 + 5 * 0.1)